@@ -8,15 +8,25 @@ Requires:
   • Python 3.6+
 
 Usage:
-  ./stitch.py [--root DIR] [--gap N] [--pattern GLOB] [-v]
+  ./stitch.py [--root DIR] [--gap N] [--pattern GLOB] [-j N] [-p N] [-v]
 """
 import argparse
+import calendar
+import concurrent.futures
+import contextlib
+import errno
+import fnmatch
+import functools
+import io
+import json
+import os
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
 from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
 
 # Regex for original DJI filenames
@@ -25,74 +35,210 @@ ORG_PATTERN = re.compile(
     re.IGNORECASE
 )
 
+# Matchers for the YYYY and MM/DD folder names of the organized tree
+_YEAR_RE = re.compile(r'\d{4}').fullmatch
+_DM_RE = re.compile(r'\d{2}').fullmatch
 
+# Matcher for the HHMMSS part of an organized clip name
+_TIME_RE = re.compile(r'\d{6}').fullmatch
+
+# Per-day sidecar caching ffprobe results between runs
+PROBE_CACHE_NAME = ".dji_probe_cache.json"
+
+# Stream fields that must match across clips for a lossless concat
+STREAM_INFO_KEYS = ("codec_name", "pix_fmt", "color_transfer")
+
+# Default number of concurrent ffprobe workers, shared across all day processes
+DEFAULT_JOBS = min(32, (os.cpu_count() or 1) * 4)
+
+# Default number of day folders stitched in parallel; stitching is disk-bound,
+# so running days concurrently is opt-in
+DEFAULT_PROCESSES = 1
+
+
+@functools.lru_cache(maxsize=1)
 def check_tools():
-    """Ensure ffmpeg & ffprobe are available."""
+    """
+    Ensure ffmpeg & ffprobe are available. Only searches PATH (no process
+    spawn) and runs once per process; worker processes rely on the parent's check.
+    """
     for cmd in ("ffmpeg", "ffprobe"):
-        try:
-            subprocess.run([cmd, "-version"], check=True,
-                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        except Exception:
+        if shutil.which(cmd) is None:
             print(f"❌ Error: {cmd} not found. Install FFmpeg and ensure it's in PATH.", file=sys.stderr)
             sys.exit(1)
 
 
+def _parse_dji_name(name: str):
+    """
+    Parse an original DJI filename into (date, time, ext), or None.
+    Slices the fixed DJI_YYYYMMDDHHMMSS_NNNN_D.ext layout directly and only
+    falls back to ORG_PATTERN for names that differ in case.
+    """
+    if (len(name) == 29 and name.startswith("DJI_") and name[18] == '_'
+            and name[23] == '_' and name[24] == 'D' and name[25] == '.'
+            and name[4:18].isdecimal() and name[19:23].isdecimal()):
+        ext = name[26:].lower()
+        if ext == "mp4" or ext == "mkv":
+            return name[4:12], name[12:18], ext
+        return None
+    m = ORG_PATTERN.match(name)
+    if not m:
+        return None
+    return m.group('date'), m.group('time'), m.group('ext').lower()
+
+
+def _scandir_recursive(path, skip_dir=None):
+    """
+    Yield os.DirEntry objects under path, recursing without following symlinks.
+    Top-level directories whose name passes skip_dir are not descended into.
+    Unreadable directories (e.g. System Volume Information) are skipped, as rglob did.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except PermissionError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if skip_dir is None or not skip_dir(entry.name):
+                yield from _scandir_recursive(entry.path)
+        else:
+            yield entry
+
+
+def _move_file(src: str, dest: str) -> None:
+    """Rename src onto dest, falling back to shutil.move across filesystems."""
+    try:
+        os.replace(src, dest)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dest)
+
+
+def _reserve_dest(dest_dir: Path, time: str, ext: str) -> Path:
+    """
+    Atomically claim a free TIME[_N].ext name in dest_dir by creating an
+    empty placeholder with O_EXCL, which the caller then moves over.
+    """
+    name = f"{time}.{ext}"
+    counter = 1
+    while True:
+        dest = dest_dir / name
+        try:
+            fd = os.open(str(dest), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            name = f"{time}_{counter}.{ext}"
+            counter += 1
+            continue
+        os.close(fd)
+        return dest
+
+
 def organize_dji_videos(root: Path, pattern: str, verbose: bool) -> int:
     """
     Move DJI clips from flat structure into YYYY/MM/DD folders,
     renaming from DJI_... to HHMMSS.ext. Returns number moved.
     """
+    # Bind hot-loop callables locally to skip global/attribute lookups
+    name_match = re.compile(fnmatch.translate(pattern)).match
+    parse = _parse_dji_name
+    reserve = _reserve_dest
+    move = _move_file
+    dest_dirs = {}  # YYYYMMDD -> created YYYY/MM/DD folder
     count = 0
-    for src in root.rglob(pattern):
-        if not src.is_file():
+    # Skip the YYYY/ trees this script has already organized
+    for entry in _scandir_recursive(root, skip_dir=_YEAR_RE):
+        if not entry.is_file(follow_symlinks=False) or not name_match(entry.name):
             continue
-        m = ORG_PATTERN.match(src.name)
-        if not m:
+        parsed = parse(entry.name)
+        if not parsed:
             continue
-        date, time, ext = m.group('date'), m.group('time'), m.group('ext').lower()
-        year, month, day = date[:4], date[4:6], date[6:8]
-        dest_dir = root / year / month / day
-        dest_dir.mkdir(parents=True, exist_ok=True)
-        new_name = f"{time}.{ext}"
-        dest = dest_dir / new_name
-        counter = 1
-        while dest.exists():
-            dest = dest_dir / f"{time}_{counter}.{ext}"
-            counter += 1
-        shutil.move(str(src), str(dest))
+        date, time, ext = parsed
+        dest_dir = dest_dirs.get(date)
+        if dest_dir is None:
+            dest_dir = root / date[:4] / date[4:6] / date[6:8]
+            dest_dir.mkdir(parents=True, exist_ok=True)
+            dest_dirs[date] = dest_dir
+        dest = reserve(dest_dir, time, ext)
+        try:
+            move(entry.path, str(dest))
+        except BaseException:
+            os.unlink(str(dest))
+            raise
         count += 1
         if verbose:
-            print(f"Moved: {src.name} -> {dest.relative_to(root)}")
+            print(f"Moved: {entry.name} -> {dest.relative_to(root)}")
     return count
 
 
-def probe_duration(path: Path) -> float:
-    """Return video duration in seconds via ffprobe."""
+def load_probe_cache(day_dir: Path) -> dict:
+    """Load the duration cache for day_dir, or an empty dict if missing/corrupt."""
+    try:
+        with open(day_dir / PROBE_CACHE_NAME) as fh:
+            cache = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_probe_cache(day_dir: Path, cache: dict) -> None:
+    """Atomically rewrite the duration cache for day_dir."""
+    tf = tempfile.NamedTemporaryFile(mode='w', dir=str(day_dir), prefix=PROBE_CACHE_NAME,
+                                     suffix='.tmp', delete=False)
+    try:
+        with tf:
+            json.dump(cache, tf)
+        os.replace(tf.name, str(day_dir / PROBE_CACHE_NAME))
+    except BaseException:
+        os.unlink(tf.name)
+        raise
+
+
+def update_probe_cache(day_dir: Path, cache: dict, original: dict, names) -> None:
+    """
+    Prune cache to the clip names still in day_dir and rewrite it if it
+    changed, removing the sidecar once no entries are left.
+    """
+    cache = {n: cache[n] for n in names if n in cache}
+    if cache == original:
+        return
+    if cache:
+        save_probe_cache(day_dir, cache)
+    else:
+        try:
+            os.unlink(str(day_dir / PROBE_CACHE_NAME))
+        except FileNotFoundError:
+            pass
+
+
+def probe_all(path: Path, cache: dict = None, size: int = None, mtime_ns: int = None) -> tuple:
+    """
+    Return (duration, stream_info) for path from a single ffprobe call, where
+    stream_info holds the first video stream's codec_name, pix_fmt and
+    color_transfer. If cache is given, reuse an entry whose size and mtime
+    (as already stat'ed by the caller) still match, and record new results.
+    """
+    if cache is not None:
+        entry = cache.get(path.name)
+        if entry and entry.get('size') == size and entry.get('mtime_ns') == mtime_ns:
+            return entry['duration'], entry['info']
     result = subprocess.run([
-        "ffprobe", "-v", "error",
+        "ffprobe", "-v", "error", "-threads", "0",
+        "-print_format", "json",
+        "-show_format", "-show_streams",
         "-select_streams", "v:0",
-        "-show_entries", "format=duration",
-        "-of", "default=noprint_wrappers=1:nokey=1",
         str(path)
     ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True)
-    return float(result.stdout)
-
-
-def probe_stream_info(path: Path) -> dict:
-    """Return key stream info (codec_name, pix_fmt, color_transfer) via ffprobe."""
-    cmd = [
-        "ffprobe", "-v", "error",
-        "-select_streams", "v:0",
-        "-show_entries", "stream=codec_name,pix_fmt,color_transfer",
-        "-of", "default=noprint_wrappers=1"
-    ]
-    result = subprocess.run(cmd + [str(path)], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True)
-    info = {}
-    for line in result.stdout.decode().splitlines():
-        if '=' in line:
-            key, val = line.split('=', 1)
-            info[key.strip()] = val.strip()
-    return info
+    data = json.loads(result.stdout)
+    duration = float(data['format']['duration'])
+    streams = data.get('streams') or [{}]
+    # The JSON writer omits unset fields; report them as "unknown" like the default writer
+    info = {k: streams[0].get(k, 'unknown') for k in STREAM_INFO_KEYS}
+    if cache is not None:
+        cache[path.name] = {'size': size, 'mtime_ns': mtime_ns,
+                            'duration': duration, 'info': info}
+    return duration, info
 
 
 def group_sequences(clips, starts, durations, max_gap, verbose=False):
@@ -100,156 +246,278 @@ def group_sequences(clips, starts, durations, max_gap, verbose=False):
     Given sorted clips, start times, durations, group into sequences
     where gap ≤ max_gap. Returns list of index lists.
     """
-    seqs = []
-    current = [0]
-    for i in range(1, len(clips)):
-        prev_end = starts[i-1] + timedelta(seconds=durations[i-1])
-        gap = (starts[i] - prev_end).total_seconds()
-        if verbose:
-            print(f"Gap: {clips[i-1].name}@{prev_end.time()} → {clips[i].name}@{starts[i].time()} = {gap:.1f}s")
-        if gap <= max_gap:
-            current.append(i)
-        else:
-            seqs.append(current)
-            current = [i]
-    seqs.append(current)
-    return seqs
-
-
-def make_concat_file(paths, verbose=False) -> Path:
-    """Write FFmpeg concat list file with absolute paths."""
-    tf = tempfile.NamedTemporaryFile(delete=False, mode='w', suffix='.txt')
-    for p in paths:
-        tf.write(f"file '{p.resolve().as_posix()}'\n")
-    tf.close()
+    # Work on plain wall-clock seconds and find all split points in one pass
+    ts = [calendar.timegm(s.timetuple()) for s in starts]
+    gaps = [ts[i] - ts[i-1] - durations[i-1] for i in range(1, len(ts))]
     if verbose:
-        print(f"Concat list: {tf.name}")
-        print(Path(tf.name).read_text())
-    return Path(tf.name)
+        for i, gap in enumerate(gaps, 1):
+            prev_end = starts[i-1] + timedelta(seconds=durations[i-1])
+            print(f"Gap: {clips[i-1].name}@{prev_end.time()} → {clips[i].name}@{starts[i].time()} = {gap:.1f}s")
+    splits = [i for i, gap in enumerate(gaps, 1) if gap > max_gap]
+    bounds = [0] + splits + [len(ts)]
+    return [list(range(a, b)) for a, b in zip(bounds, bounds[1:])]
 
 
-def run_concat_and_cleanup(seq_paths, output_dir: Path, start_time: str, verbose: bool) -> None:
+def run_concat_and_cleanup(seq_paths, output_dir: Path, start_time: str, verbose: bool,
+                           capture_stderr: bool = False) -> None:
     """
     Concatenate seq_paths into a temp file, delete sources, rename to TIME.mp4.
+    The concat list is piped to ffmpeg's stdin. With capture_stderr, ffmpeg's
+    log is captured and re-printed to sys.stderr instead of inherited directly.
     """
+    out = str(output_dir)
     temp_name = f"stitched_{start_time}.mp4"
     final_name = f"{start_time}.mp4"
-    temp_path = output_dir / temp_name
-    list_file = make_concat_file(seq_paths, verbose)
+    temp_path = os.path.join(out, temp_name)
+    # Feed the concat list to ffmpeg on stdin rather than via a temp file.
+    # All clips live in output_dir, so resolve it once rather than per clip.
+    base = output_dir.resolve().as_posix()
+    list_text = "".join(f"file '{base}/{p.name}'\n" for p in seq_paths)
+    if verbose:
+        print("Concat list:")
+        print(list_text, end='')
 
     cmd = [
         "ffmpeg", "-f", "concat", "-safe", "0",
-        "-i", str(list_file), "-c", "copy", "-y"
+        "-protocol_whitelist", "pipe,file",
+        "-i", "-", "-c", "copy", "-y"
     ]
     if not verbose:
         cmd += ["-loglevel", "error"]
+    elif capture_stderr:
+        cmd += ["-nostats"]
     if verbose:
         print(f"Running concat → {temp_name}")
-    subprocess.run(cmd + [str(temp_path)], check=True)
+    result = subprocess.run(cmd + [temp_path], input=list_text.encode(),
+                            stderr=subprocess.PIPE if capture_stderr else None)
+    if result.stderr:
+        print(result.stderr.decode(errors='replace'), end='', file=sys.stderr)
+    result.check_returncode()
 
     for p in seq_paths:
         try:
-            p.unlink()
+            os.unlink(str(p))
             if verbose:
                 print(f"Deleted source: {p.name}")
         except FileNotFoundError:
             if verbose:
                 print(f"Warning: source not found: {p.name}")
 
-    final_path = output_dir / final_name
-    temp_path.replace(final_path)
+    os.replace(temp_path, os.path.join(out, final_name))
     if verbose:
         print(f"Renamed {temp_name} → {final_name}")
 
 
-def stitch_day_directory(day_dir: Path, max_gap: float, verbose: bool) -> int:
+def stitch_day_directory(day_dir: Path, max_gap: float, verbose: bool, jobs: int = DEFAULT_JOBS,
+                         capture_stderr: bool = False) -> int:
     """
     Stitch all sequences in a YYYY/MM/DD folder. Returns count stitched.
     """
+    year, month, day = int(day_dir.parent.parent.name), int(day_dir.parent.name), int(day_dir.name)
+    has_cache = False
+    candidates = []
+    with os.scandir(day_dir) as it:
+        for entry in it:
+            if entry.name == PROBE_CACHE_NAME:
+                has_cache = True
+            elif entry.name.lower().endswith((".mp4", ".mkv")) and entry.is_file():
+                candidates.append((entry.name, entry.path, entry.stat()))
+    candidates.sort()
+
     clips = []
-    starts, durations = [], []
-    for ext in ("mp4", "mkv"):
-        for f in sorted(day_dir.glob(f"*.{ext}")):
-            parts = f.stem.split('_')
-            time_part = next((p for p in parts if re.fullmatch(r"\d{6}", p)), None)
-            if not time_part:
-                if verbose:
-                    print(f"Skipping {f.name}: no valid HHMMSS timestamp found")
-                continue
-            hh, mm, ss = time_part[:2], time_part[2:4], time_part[4:6]
-            try:
-                start_dt = datetime(
-                    int(day_dir.parent.parent.name),
-                    int(day_dir.parent.name),
-                    int(day_dir.name),
-                    int(hh), int(mm), int(ss)
-                )
-            except ValueError:
-                if verbose:
-                    print(f"Skipping {f.name}: invalid time {time_part}")
-                continue
-            clips.append(f)
-            starts.append(start_dt)
-            durations.append(probe_duration(f))
+    starts = []
+    stats = []  # (size, mtime_ns) per clip, reused as the probe cache key
+    for name, path, st in candidates:
+        if not st.st_size:
+            # e.g. a placeholder left by an interrupted organize step
+            if verbose:
+                print(f"Skipping {name}: empty file")
+            continue
+        parts = name[:-4].split('_')
+        time_part = next((p for p in parts if _TIME_RE(p)), None)
+        if not time_part:
+            if verbose:
+                print(f"Skipping {name}: no valid HHMMSS timestamp found")
+            continue
+        try:
+            start_dt = datetime(year, month, day,
+                                int(time_part[:2]), int(time_part[2:4]), int(time_part[4:6]))
+        except ValueError:
+            if verbose:
+                print(f"Skipping {name}: invalid time {time_part}")
+            continue
+        clips.append(Path(path))
+        starts.append(start_dt)
+        stats.append((st.st_size, st.st_mtime_ns))
+
+    # Nothing to stitch, so skip probing entirely
+    if len(clips) < 2:
+        if has_cache:
+            cache = load_probe_cache(day_dir)
+            update_probe_cache(day_dir, cache, dict(cache), [f.name for f in clips])
+        return 0
+
+    cache = load_probe_cache(day_dir) if has_cache else {}
+    original_cache = dict(cache)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        probes = list(executor.map(lambda f, st: probe_all(f, cache, *st), clips, stats))
 
-    order = sorted(range(len(clips)), key=lambda i: starts[i])
-    clips = [clips[i] for i in order]
-    starts = [starts[i] for i in order]
-    durations = [durations[i] for i in order]
+    rows = sorted(zip(starts, clips, probes), key=itemgetter(0))
+    starts, clips, probes = map(list, zip(*rows))
+    durations = [d for d, _ in probes]
+    stream_infos = [info for _, info in probes]
 
     seqs = group_sequences(clips, starts, durations, max_gap, verbose)
     stitched = 0
-    for seq in seqs:
-        if len(seq) < 2:
-            continue
-        seq_paths = [clips[i] for i in seq]
-        # Check codec and pixel format consistency
-        infos = [probe_stream_info(p) for p in seq_paths]
-        first = infos[0]
-        mismatches = [i for i,info in enumerate(infos[1:],1)
-                      if info.get('codec_name') != first.get('codec_name')
-                      or info.get('pix_fmt') != first.get('pix_fmt')
-                      or info.get('color_transfer') != first.get('color_transfer')]
-        if mismatches:
-            print(f"⚠️ Skipping stitching starting {starts[seq[0]].strftime('%Y%m%d_%H%M%S')}: codec/pix_fmt/color_transfer mismatch:")
-            for idx in [0] + mismatches:
-                p = seq_paths[idx]
-                info = infos[idx]
-                print(f"  {p.name} → codec={info.get('codec_name')}, pix_fmt={info.get('pix_fmt')}, transfer={info.get('color_transfer')}")
-            continue
-        start_time = starts[seq[0]].strftime("%Y%m%d_%H%M%S")
-        print(f"Stitching {len(seq_paths)} clips starting at {start_time}")
-        print("Files to stitch:")
-        for clip in seq_paths:
-            print(f"  {clip.name}")
-        run_concat_and_cleanup(seq_paths, day_dir, start_time, verbose)
-        stitched += 1
+    deleted = set()
+    try:
+        for seq in seqs:
+            if len(seq) < 2:
+                continue
+            seq_paths = [clips[i] for i in seq]
+            # Check codec and pixel format consistency
+            infos = [stream_infos[i] for i in seq]
+            first = infos[0]
+            mismatches = [i for i,info in enumerate(infos[1:],1)
+                          if info.get('codec_name') != first.get('codec_name')
+                          or info.get('pix_fmt') != first.get('pix_fmt')
+                          or info.get('color_transfer') != first.get('color_transfer')]
+            if mismatches:
+                print(f"⚠️ Skipping stitching starting {starts[seq[0]].strftime('%Y%m%d_%H%M%S')}: codec/pix_fmt/color_transfer mismatch:")
+                for idx in [0] + mismatches:
+                    p = seq_paths[idx]
+                    info = infos[idx]
+                    print(f"  {p.name} → codec={info.get('codec_name')}, pix_fmt={info.get('pix_fmt')}, transfer={info.get('color_transfer')}")
+                continue
+            start_time = starts[seq[0]].strftime("%Y%m%d_%H%M%S")
+            print(f"Stitching {len(seq_paths)} clips starting at {start_time}")
+            print("Files to stitch:")
+            for clip in seq_paths:
+                print(f"  {clip.name}")
+            run_concat_and_cleanup(seq_paths, day_dir, start_time, verbose, capture_stderr)
+            deleted.update(p.name for p in seq_paths)
+            stitched += 1
+    finally:
+        # Keep entries only for clips that survived stitching
+        update_probe_cache(day_dir, cache, original_cache,
+                           [f.name for f in clips if f.name not in deleted])
     return stitched
 
 
+def _stitch_day_worker(day_path: str, max_gap: float, verbose: bool, jobs: int) -> tuple:
+    """
+    Run stitch_day_directory in a worker process, buffering its stdout and
+    stderr (including ffmpeg's) so days processed in parallel don't
+    interleave. Returns (count, output, errors); on failure the partial
+    buffers are attached to the exception as day_output and day_errors.
+    """
+    out, err = io.StringIO(), io.StringIO()
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            stitched = stitch_day_directory(Path(day_path), max_gap, verbose, jobs, capture_stderr=True)
+    except Exception as e:
+        # Hand the partial logs back to the parent along with the error
+        e.day_output = out.getvalue()
+        e.day_errors = err.getvalue()
+        raise
+    return stitched, out.getvalue(), err.getvalue()
+
+
+def _scan_digit_dirs(path, name_match):
+    """Yield (name, path) for subdirectories of path whose name passes name_match."""
+    with os.scandir(path) as it:
+        for entry in it:
+            if name_match(entry.name) and entry.is_dir():
+                yield entry.name, entry.path
+
+
+def iter_day_dirs(root) -> list:
+    """
+    Return sorted (year, month, day, day_path) tuples for every
+    YYYY/MM/DD folder under root.
+    """
+    days = []
+    for year, year_path in _scan_digit_dirs(root, _YEAR_RE):
+        for month, month_path in _scan_digit_dirs(year_path, _DM_RE):
+            for day, day_path in _scan_digit_dirs(month_path, _DM_RE):
+                days.append((year, month, day, day_path))
+    return sorted(days, key=itemgetter(0, 1, 2))
+
+
 def main():
     p = argparse.ArgumentParser(description="Organize & auto-stitch DJI clips.")
     p.add_argument("--root", type=Path, default=Path('.'), help="Scan root (default cwd)")
-    p.add_argument("--pattern", default="DJI_*.[mM][pP]4", help="Glob for originals")
+    p.add_argument("--pattern", default="DJI_*.[mM][pP]4", help="Glob for original file names")
     p.add_argument("--gap", type=float, default=30, help="Max gap in seconds")
+    p.add_argument("-j", "--jobs", type=int, default=DEFAULT_JOBS,
+                   help=f"Concurrent ffprobe workers, split across --processes (default {DEFAULT_JOBS})")
+    p.add_argument("-p", "--processes", type=int, default=DEFAULT_PROCESSES,
+                   help=f"Day folders to stitch in parallel (default {DEFAULT_PROCESSES})")
     p.add_argument("-v", "--verbose", action="store_true", help="Verbose logs")
     args = p.parse_args()
+    # Originals are matched by file name during the directory walk
+    if "/" in args.pattern or os.sep in args.pattern:
+        p.error("--pattern is matched against file names only and cannot contain a directory part")
 
     check_tools()
     moved = organize_dji_videos(args.root, args.pattern, args.verbose)
     print(f"Organized {moved} clips.")
 
+    days = iter_day_dirs(args.root)
     total = 0
-    for year in sorted(args.root.iterdir()):
-        if not year.is_dir() or not year.name.isdigit(): continue
-        for month in sorted(year.iterdir()):
-            if not month.is_dir() or not month.name.isdigit(): continue
-            for day in sorted(month.iterdir()):
-                if not day.is_dir() or not day.name.isdigit(): continue
-                stitched = stitch_day_directory(day, args.gap, args.verbose)
-                if stitched and args.verbose:
-                    print(f"→ {stitched} stitched in {year.name}/{month.name}/{day.name}")
-                total += stitched
+    if args.processes <= 1 or len(days) <= 1:
+        for year, month, day, day_path in days:
+            stitched = stitch_day_directory(Path(day_path), args.gap, args.verbose, args.jobs)
+            if stitched and args.verbose:
+                print(f"→ {stitched} stitched in {year}/{month}/{day}")
+            total += stitched
+    else:
+        # Split the ffprobe budget so -p doesn't multiply it
+        day_jobs = max(1, args.jobs // args.processes)
+        error = None
+        failed = False
+        running = {}   # future -> index into days
+        finished = {}  # index -> future, held until earlier days are reported
+        next_day = 0
+        reported = 0
+        with concurrent.futures.ProcessPoolExecutor(max_workers=args.processes) as executor:
+            while True:
+                # Keep every worker busy, but start no new days once one has
+                # failed, just like the serial loop.
+                while not failed and next_day < len(days) and len(running) < args.processes:
+                    future = executor.submit(_stitch_day_worker, days[next_day][3], args.gap,
+                                             args.verbose, day_jobs)
+                    running[future] = next_day
+                    next_day += 1
+                if not running:
+                    break
+                done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    finished[running.pop(future)] = future
+                    if future.exception() is not None:
+                        failed = True
+                # Report in date order as soon as each day's predecessors are done
+                while reported in finished:
+                    year, month, day, _ = days[reported]
+                    future = finished.pop(reported)
+                    reported += 1
+                    try:
+                        stitched, output, errors = future.result()
+                    except Exception as e:
+                        print(getattr(e, 'day_output', ''), end='')
+                        print(getattr(e, 'day_errors', ''), end='', file=sys.stderr)
+                        print(f"❌ Error stitching {year}/{month}/{day}: {e}", file=sys.stderr)
+                        if error is None:
+                            error = e
+                        continue
+                    print(output, end='')
+                    print(errors, end='', file=sys.stderr)
+                    if stitched and args.verbose:
+                        print(f"→ {stitched} stitched in {year}/{month}/{day}")
+                    total += stitched
+        if error is not None:
+            print(f"Stopped after error: {total} stitched files created.", file=sys.stderr)
+            raise error
 
     print(f"Done: {total} stitched files created.")
 